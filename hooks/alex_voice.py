@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = ["requests"]
-# ///
+#!/Users/coreyyoung/.claude/hooks/.venv/bin/python
 
 """
 Alex Voice Notification Hook (Stop Event)
@@ -23,14 +20,40 @@ from utils.voice import speak_and_notify
 LOGS_DIR = Path.home() / '.claude' / 'logs' / 'hooks'
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Compiled once at import — these run on every Stop event.
+# Single alternation covers both 'CUSTOM COMPLETED:' and 'COMPLETED:'
+# markers in one scan instead of two sequential searches.
+_PAT_MARKER = re.compile(r'(?:CUSTOM\s+)?COMPLETED[:\s]+(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+_WS_RE = re.compile(r'\s+')
+
+# Smart-summary filters, also per-invocation hot
+_RULE_RE = re.compile(r'^[-=*_]{3,}$')
+_PATHLIKE_RE = re.compile(r'^(/|\.\.?/|\w+/)')
+_BULLET_ONLY_RE = re.compile(r'^[-*+]\s*$')
+_CODE_START_RE = re.compile(r'^(import |from |def |class |func |const |let |var |return |\{|\[)')
+_MD_ALL_RE = re.compile(r'[*_`#]+')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_BULLET_PREFIX_RE = re.compile(r'^[-*+]\s+')
+_NUM_PREFIX_RE = re.compile(r'^\d+\.\s+')
+
+# Deletion table for markdown emphasis chars — a str.translate pass is
+# far cheaper than a regex substitution for single-char stripping
+_MD_TBL = str.maketrans('', '', '*_`')
+
+
+_LOG_FH = None
 
 def log(message: str, level: str = "INFO"):
+    """Append to the log via a handle opened once per process."""
+    global _LOG_FH
     from datetime import datetime
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] [alex_voice] [{level}] {message}\n"
-    log_file = LOGS_DIR / 'voice_notifications.log'
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    if _LOG_FH is None:
+        import atexit
+        _LOG_FH = open(LOGS_DIR / 'voice_notifications.log', 'a', buffering=8192)
+        atexit.register(_LOG_FH.close)
+    _LOG_FH.write(log_entry)
 
 
 def is_subagent(data: dict) -> bool:
@@ -45,17 +68,24 @@ def is_subagent(data: dict) -> bool:
 def extract_custom_completed(text: str) -> str:
     """Extract completion message from response, or generate a smart summary."""
 
-    # Pattern 1: CUSTOM COMPLETED: message (with or without emoji prefix)
-    pattern1 = r'CUSTOM COMPLETED[:\s]+(.+?)(?:\n|$)'
-    match = re.search(pattern1, text, re.IGNORECASE | re.MULTILINE)
-    if match:
-        return clean_message(match.group(1).strip())
-
-    # Pattern 2: COMPLETED: message
-    pattern2 = r'COMPLETED[:\s]+(.+?)(?:\n|$)'
-    match = re.search(pattern2, text, re.IGNORECASE | re.MULTILINE)
-    if match:
-        return clean_message(match.group(1).strip())
+    # The completion marker is emitted at the end of output, so search
+    # the tail first — O(1) in transcript length instead of walking a
+    # multi-KB response with a MULTILINE regex.
+    tail = text[-2048:]
+    if 'COMPLETED' in tail.upper():
+        # Covers 'CUSTOM COMPLETED: message' and 'COMPLETED: message',
+        # with or without emoji prefix
+        match = _PAT_MARKER.search(tail)
+        if match:
+            return clean_message(match.group(1).strip())
+
+    # Tail missed: full scan only for long responses whose marker sits
+    # unusually early (cheap substring probe gates the regex walk)
+    if len(text) > 2048 and 'COMPLETED' in text.upper():
+        log("Completion marker not in tail, falling back to full scan", "DEBUG")
+        match = _PAT_MARKER.search(text)
+        if match:
+            return clean_message(match.group(1).strip())
 
     # No marker -- try smart summary
     summary = extract_smart_summary(text)
@@ -78,13 +108,13 @@ def extract_smart_summary(text: str) -> str:
             continue
         if stripped.startswith('#'):
             continue
-        if re.match(r'^[-=*_]{3,}$', stripped):
+        if _RULE_RE.match(stripped):
             continue
         if stripped.startswith('```'):
             continue
-        if re.match(r'^(/|\.\.?/|\w+/)', stripped) and '/' in stripped and ' ' not in stripped:
+        if _PATHLIKE_RE.match(stripped) and '/' in stripped and ' ' not in stripped:
             continue
-        if re.match(r'^[-*+]\s*$', stripped):
+        if _BULLET_ONLY_RE.match(stripped):
             continue
         candidate_lines.append(stripped)
 
@@ -96,14 +126,14 @@ def extract_smart_summary(text: str) -> str:
     if '?' in first_line and not first_line.startswith(('I ', 'The ', 'This ', 'That ', 'All ')):
         return ""
 
-    if re.match(r'^(import |from |def |class |func |const |let |var |return |\{|\[)', first_line):
+    if _CODE_START_RE.match(first_line):
         return ""
 
-    cleaned = re.sub(r'[*_`#]+', '', first_line)
-    cleaned = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', cleaned)
-    cleaned = re.sub(r'^[-*+]\s+', '', cleaned)
-    cleaned = re.sub(r'^\d+\.\s+', '', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _MD_ALL_RE.sub('', first_line)
+    cleaned = _LINK_RE.sub(r'\1', cleaned)
+    cleaned = _BULLET_PREFIX_RE.sub('', cleaned)
+    cleaned = _NUM_PREFIX_RE.sub('', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned).strip()
 
     if not cleaned or len(cleaned) < 10:
         return ""
@@ -117,13 +147,36 @@ def extract_smart_summary(text: str) -> str:
 
 def clean_message(message: str) -> str:
     """Clean up extracted message for voice."""
-    message = re.sub(r'[*_`]+', '', message)
-    message = message.replace('\n', ' ').replace('\r', ' ')
-    message = re.sub(r'\s+', ' ', message)
+    # Output caps at 8 words / 80 chars — no point cleaning a long tail
+    # that gets discarded anyway
+    if len(message) > 512:
+        message = message[:512]
+    # Most completion messages carry no markdown at all; skip the
+    # translate pass when none of the stripped chars are present
+    if '*' in message or '_' in message or '`' in message:
+        message = message.translate(_MD_TBL)
+    # Single split tokenizes once, collapsing all whitespace (incl. \n/\r)
     words = message.split()
     if len(words) > 8:
-        message = ' '.join(words[:8])
-    return message.strip()[:80]
+        words = words[:8]
+    return ' '.join(words)[:80]
+
+
+def extract_response_text(data) -> str:
+    """Pull the response text out of Stop event data in one pass."""
+    if not isinstance(data, dict):
+        return ""
+    text = (
+        data.get('last_assistant_message')
+        or data.get('content')
+        or data.get('text')
+        or data.get('message')
+        or ''
+    )
+    if isinstance(text, list):
+        # Content-block list: join once instead of += per block
+        return '\n'.join(b['text'] for b in text if isinstance(b, dict) and 'text' in b)
+    return text if isinstance(text, str) else ""
 
 
 def main():
@@ -138,22 +191,7 @@ def main():
             return
 
         # Extract response text
-        response_text = ""
-        if isinstance(data, dict):
-            if 'last_assistant_message' in data:
-                response_text = data['last_assistant_message']
-            elif 'content' in data:
-                content = data['content']
-                if isinstance(content, str):
-                    response_text = content
-                elif isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and 'text' in block:
-                            response_text += block['text'] + '\n'
-            elif 'text' in data:
-                response_text = data['text']
-            elif 'message' in data:
-                response_text = data['message']
+        response_text = extract_response_text(data)
 
         if not response_text:
             log("No response text found in Stop event data", "WARN")
@@ -18,6 +18,19 @@ CLAUDE_HOME = Path("/Users/coreyyoung/.claude")
 CORE_SKILL = CLAUDE_HOME / "skills" / "CORE" / "SKILL.md"
 HOOK_LOG = CLAUDE_HOME / "debug" / "hook.log"
 
+# mtime-keyed cache so a warm process doesn't re-read the skill from disk
+_CORE_CACHE = {"mtime": 0.0, "content": None}
+
+def read_core_skill() -> str:
+    """Read the CORE skill, reusing the cached copy when unchanged."""
+    mtime = CORE_SKILL.stat().st_mtime
+    if _CORE_CACHE["content"] is not None and _CORE_CACHE["mtime"] == mtime:
+        return _CORE_CACHE["content"]
+    content = CORE_SKILL.read_text()
+    _CORE_CACHE["mtime"] = mtime
+    _CORE_CACHE["content"] = content
+    return content
+
 def log(msg: str):
     """Log to debug file (set HOOK_LOG to enable)"""
     try:
@@ -44,23 +57,21 @@ def main():
         log(f"No valid input from stdin: {e}")
         sys.exit(0)
 
-    # Check if CORE skill exists
-    if not CORE_SKILL.exists():
-        log(f"CORE skill not found at {CORE_SKILL}")
-        print("⚠️  PAI Setup: CORE skill not found", file=sys.stderr)
-        print(f"   Expected: {CORE_SKILL}", file=sys.stderr)
-        print("   Run: Create CORE skill to set up your identity", file=sys.stderr)
-        sys.exit(0)
-
-    # Load and inject CORE skill context
+    # Load and inject CORE skill context (single stat via read_core_skill,
+    # no separate .exists() probe)
     try:
-        core_content = CORE_SKILL.read_text()
+        core_content = read_core_skill()
         content_lines = len(core_content.splitlines())
         content_chars = len(core_content)
         log(f"Loaded CORE skill: {content_lines} lines, {content_chars} chars")
         # Output the CORE skill content to stdout for Claude Code to inject
         print(core_content)
         log("CORE skill injected to stdout")
+    except FileNotFoundError:
+        log(f"CORE skill not found at {CORE_SKILL}")
+        print("⚠️  PAI Setup: CORE skill not found", file=sys.stderr)
+        print(f"   Expected: {CORE_SKILL}", file=sys.stderr)
+        print("   Run: Create CORE skill to set up your identity", file=sys.stderr)
     except Exception as e:
         log(f"Error loading CORE skill: {e}")
         print(f"⚠️  Error loading CORE skill: {e}", file=sys.stderr)
@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# dependencies = ["psycopg[binary]"]
+# dependencies = ["psycopg[binary]", "orjson"]
 # ///
 """
 Memory Restore Hook (SessionStart)
@@ -18,6 +18,11 @@ import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 CORE_SKILL = Path.home() / ".claude" / "skills" / "core" / "SKILL.md"
@@ -47,8 +52,9 @@ def touch_loaded_episodes(episodes: list[dict]):
 
 def main():
     try:
-        hook_input = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        raw = sys.stdin.buffer.read()
+        hook_input = orjson.loads(raw) if orjson else json.loads(raw)
+    except ValueError:
         hook_input = {}
 
     cwd = hook_input.get("cwd", os.getcwd())
@@ -125,7 +131,10 @@ def main():
         else:
             result = {"continue": True}
 
-    print(json.dumps(result))
+    if orjson:
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+    else:
+        print(json.dumps(result))
 
 
 if __name__ == "__main__":
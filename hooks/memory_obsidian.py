@@ -8,6 +8,9 @@ Output: ~/Desktop/The_Hub/AI-Memory/{product}.md per product.
 Source of truth remains Neon. This is a read-only export layer.
 """
 
+import hashlib
+import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +29,29 @@ TYPE_HEADERS = {
 }
 
 
+def _content_digest(episodes: list[dict]) -> str:
+    """Hash the fields that feed the markdown, so unchanged exports can be skipped."""
+    payload = [
+        [ep.get(k) for k in ("episode_type", "subject", "content", "reasoning", "salience", "tags", "created_at")]
+        for ep in episodes
+    ]
+    return hashlib.blake2b(
+        json.dumps(payload, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _existing_digest(path: Path) -> str:
+    """Read back the content-hash marker from a previous export."""
+    try:
+        with open(path) as f:
+            for line in f.read(2048).splitlines():
+                if line.startswith("<!-- content-hash: "):
+                    return line[len("<!-- content-hash: "):].rstrip(" ->")
+    except OSError:
+        pass
+    return ""
+
+
 def export_product(product: str, episodes: list[dict]) -> Path:
     """Export a single product's episodes to markdown."""
     OBSIDIAN_DIR.mkdir(parents=True, exist_ok=True)
@@ -33,63 +59,68 @@ def export_product(product: str, episodes: list[dict]) -> Path:
     safe_name = "".join(c if c.isalnum() or c in "-_" else "-" for c in product)
     output_file = OBSIDIAN_DIR / f"{safe_name}.md"
 
+    # Skip the rebuild+write entirely when nothing human-visible changed
+    # (only the export timestamp would differ).
+    digest = _content_digest(episodes)
+    if digest == _existing_digest(output_file):
+        return output_file
+
     # Group by type
     by_type: dict[str, list[dict]] = {}
     for ep in episodes:
         t = ep.get("episode_type", "fact")
         by_type.setdefault(t, []).append(ep)
 
-    lines = [
-        f"# {product.title()} — Memory",
-        "",
-        f"*Auto-exported from Neon memory DB — {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-        f"*{len(episodes)} active episodes*",
-        "",
-        "---",
-        "",
-    ]
-
-    for etype in ["decision", "preference", "insight", "fact", "failure", "relationship"]:
-        eps = by_type.get(etype, [])
-        if not eps:
-            continue
-
-        header = TYPE_HEADERS.get(etype, etype.title())
-        lines.append(f"## {header}")
-        lines.append("")
-
-        for ep in eps:
-            salience = ep.get("salience", 5)
-            subject = ep.get("subject", "")
-            content = ep.get("content", "")
-            reasoning = ep.get("reasoning", "")
-            tags = ep.get("tags", [])
-            created = ep.get("created_at", "")
-
-            # Salience indicator
-            indicator = "!!!" if salience >= 8 else "!" if salience >= 5 else ""
-
-            lines.append(f"### {indicator} {subject}")
-            lines.append("")
-            lines.append(content)
-            if reasoning:
-                lines.append(f"")
-                lines.append(f"> **Why:** {reasoning}")
-            lines.append("")
-
-            meta_parts = [f"Salience: {salience}/10"]
-            if tags:
-                # Filter out migration tags for cleaner display
-                display_tags = [t for t in tags if t not in ("migrated", "json", "memory-md")]
-                if display_tags:
-                    meta_parts.append(f"Tags: {', '.join(display_tags)}")
-            if created:
-                ts = created if isinstance(created, str) else created.isoformat()
-                meta_parts.append(f"Created: {ts[:10]}")
-            lines.append(f"*{' | '.join(meta_parts)}*")
-            lines.append("")
-
-    output_file.write_text("\n".join(lines))
+    # Stream directly to the file — avoids materializing the whole
+    # document as a list of lines plus a joined copy. Write to a temp
+    # file and rename so Obsidian's watcher never sees a half-written
+    # export.
+    tmp_path = output_file.with_suffix(".md.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(f"# {product.title()} — Memory\n")
+        f.write(f"<!-- content-hash: {digest} -->\n")
+        f.write("\n")
+        f.write(f"*Auto-exported from Neon memory DB — {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+        f.write(f"*{len(episodes)} active episodes*\n")
+        f.write("\n---\n\n")
+
+        for etype in ["decision", "preference", "insight", "fact", "failure", "relationship"]:
+            eps = by_type.get(etype, [])
+            if not eps:
+                continue
+
+            header = TYPE_HEADERS.get(etype, etype.title())
+            f.write(f"## {header}\n\n")
+
+            for ep in eps:
+                salience = ep.get("salience", 5)
+                subject = ep.get("subject", "")
+                content = ep.get("content", "")
+                reasoning = ep.get("reasoning", "")
+                tags = ep.get("tags", [])
+                created = ep.get("created_at", "")
+
+                # Salience indicator
+                indicator = "!!!" if salience >= 8 else "!" if salience >= 5 else ""
+
+                f.write(f"### {indicator} {subject}\n\n")
+                f.write(f"{content}\n")
+                if reasoning:
+                    f.write(f"\n> **Why:** {reasoning}\n")
+                f.write("\n")
+
+                meta_parts = [f"Salience: {salience}/10"]
+                if tags:
+                    # Filter out migration tags for cleaner display
+                    display_tags = [t for t in tags if t not in ("migrated", "json", "memory-md")]
+                    if display_tags:
+                        meta_parts.append(f"Tags: {', '.join(display_tags)}")
+                if created:
+                    ts = created if isinstance(created, str) else created.isoformat()
+                    meta_parts.append(f"Created: {ts[:10]}")
+                f.write(f"*{' | '.join(meta_parts)}*\n\n")
+
+    os.replace(tmp_path, output_file)
     return output_file
 
 
@@ -119,13 +150,60 @@ def export_single(product: str):
         print(f"No episodes found for product: {product}")
 
 
+# Coalesce bursts: skip a fresh export when one just ran
+DEBOUNCE_SECONDS = 2.0
+_STAMP_FILE = OBSIDIAN_DIR / ".last-export"
+
+
+def _debounced() -> bool:
+    """True when an export ran within the debounce window."""
+    import time
+
+    try:
+        if time.time() - _STAMP_FILE.stat().st_mtime < DEBOUNCE_SECONDS:
+            return True
+    except FileNotFoundError:
+        pass
+    try:
+        _STAMP_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _STAMP_FILE.touch()
+    except OSError:
+        pass
+    return False
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--product", help="Export single product")
+    parser.add_argument("--sync", action="store_true", help="Run export in the foreground")
     args = parser.parse_args()
 
+    # Rapid successive invocations (e.g. several /remember saves in a
+    # burst) coalesce into the first export; manual --sync always runs.
+    if not args.sync and _debounced():
+        print("Obsidian export debounced (ran moments ago).")
+        return
+
+    # The export is a read-only convenience layer — fork it off the
+    # caller's critical path (/remember and /forget invoke this inline)
+    # unless --sync is given for manual runs.
+    if not args.sync and hasattr(os, "fork"):
+        pid = os.fork()
+        if pid > 0:
+            print("Obsidian export started in background.")
+            return
+        # Child: detach from the caller's stdout and do the work.
+        sys.stdout = open(os.devnull, "w")
+        try:
+            if args.product:
+                export_single(args.product)
+            else:
+                export_all()
+        finally:
+            os._exit(0)
+
     if args.product:
         export_single(args.product)
     else:
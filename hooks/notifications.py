@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = ["requests"]
-# ///
+#!/Users/coreyyoung/.claude/hooks/.venv/bin/python
 
 """
 Notification Hook (Notification Event)
@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = []
-# ///
+#!/usr/bin/env python3
 
 """
 PermissionDenied Hook (v2.1.90+)
@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = []
-# ///
+#!/usr/bin/env python3
 """
 Plan Accepted Context Loader — runs on ExitPlanMode (plan accepted).
 
@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = ["requests"]
-# ///
+#!/Users/coreyyoung/.claude/hooks/.venv/bin/python
 
 """
 Session greeting hook — sends a voice greeting when a new session starts.
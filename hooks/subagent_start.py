@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = []
-# ///
+#!/usr/bin/env python3
 
 """
 Subagent Context Loading Hook (SubagentStart Event)
@@ -21,28 +18,43 @@ CORE_SKILL = PAI_DIR / 'skills' / 'CORE' / 'SKILL.md'
 LOGS_DIR = PAI_DIR / 'logs' / 'hooks'
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+_LOG_FH = None
+
 def log(message: str, level: str = "INFO"):
-    """Simple logging to file"""
+    """Simple logging to file — handle opened once per process"""
+    global _LOG_FH
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] [subagent_start] [{level}] {message}\n"
 
-    log_file = LOGS_DIR / 'context_loading.log'
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    if _LOG_FH is None:
+        import atexit
+        _LOG_FH = open(LOGS_DIR / 'context_loading.log', 'a', buffering=8192)
+        atexit.register(_LOG_FH.close)
+    _LOG_FH.write(log_entry)
+
+# mtime-keyed cache so repeated loads in a warm process skip the disk read
+_CORE_CACHE = {'mtime': 0.0, 'body': None}
 
 def load_pai_context() -> str:
     """Load PAI CORE context — body only (skip frontmatter to save tokens)."""
     try:
-        if not CORE_SKILL.exists():
+        # Single stat serves both the presence check and the cache key
+        try:
+            skill_file = CORE_SKILL
+            mtime = skill_file.stat().st_mtime
+        except FileNotFoundError:
             # Try lowercase fallback
-            alt = CORE_SKILL.parent.parent / 'core' / 'SKILL.md'
-            if alt.exists():
-                content = alt.read_text()
-            else:
+            skill_file = CORE_SKILL.parent.parent / 'core' / 'SKILL.md'
+            try:
+                mtime = skill_file.stat().st_mtime
+            except FileNotFoundError:
                 log(f"CORE skill not found at {CORE_SKILL}", "ERROR")
                 return ""
-        else:
-            content = CORE_SKILL.read_text()
+
+        if _CORE_CACHE['body'] is not None and _CORE_CACHE['mtime'] == mtime:
+            return _CORE_CACHE['body']
+
+        content = skill_file.read_text()
 
         # Extract body after frontmatter (skip YAML metadata)
         parts = content.split("---", 2)
@@ -51,6 +63,9 @@ def load_pai_context() -> str:
         else:
             body = content
 
+        _CORE_CACHE['mtime'] = mtime
+        _CORE_CACHE['body'] = body
+
         log(f"Loaded CORE body ({len(body)} chars)", "INFO")
         return body
 
@@ -1,7 +1,4 @@
-#!/usr/bin/env -S uv run --script
-# /// script
-# dependencies = ["requests"]
-# ///
+#!/Users/coreyyoung/.claude/hooks/.venv/bin/python
 
 """
 Subagent Stop Hook (SubagentStop Event)
@@ -10,9 +7,9 @@ Triggers when a subagent completes its task.
 Saves agent transcript and announces completion in the agent's mapped voice.
 """
 
+import os
 import sys
 import json
-import shutil
 from pathlib import Path
 from datetime import datetime
 
@@ -25,37 +22,77 @@ LOGS_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR = Path.home() / '.claude' / 'agent-output-context'
 
 
+_LOG_FH = None
+
 def log(message: str, level: str = "INFO"):
+    """Append to the log via a handle opened once per process."""
+    global _LOG_FH
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] [subagent_stop] [{level}] {message}\n"
-    log_file = LOGS_DIR / 'subagent_stop.log'
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    if _LOG_FH is None:
+        import atexit
+        # Line-buffered keeps entries atomic without per-call open/close
+        _LOG_FH = open(LOGS_DIR / 'subagent_stop.log', 'a', buffering=1)
+        atexit.register(_LOG_FH.close)
+    _LOG_FH.write(log_entry)
+
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def _subagent_type_from_line(line: bytes) -> str:
+    """Parse one transcript line and return its Task subagent_type, if any."""
+    try:
+        data = _loads(line)
+        message = data.get('message', {})
+        content = message.get('content', [])
+        for item in content:
+            if isinstance(item, dict) and item.get('type') == 'tool_use' and item.get('name') == 'Task':
+                input_params = item.get('input', {})
+                if 'subagent_type' in input_params:
+                    return input_params['subagent_type']
+    except (ValueError, KeyError, TypeError):
+        pass
+    return ''
 
 
 def extract_agent_name_from_parent_session(parent_session_path: str, agent_id: str = '') -> str:
-    """Extract agent name from parent session transcript."""
+    """Extract agent name from parent session transcript.
+
+    Only the most recent Task invocation matters, so read the file
+    backward in chunks and stop at the first hit instead of parsing
+    every event in a multi-MB transcript.
+    """
     try:
         session_file = Path(parent_session_path)
-        if not session_file.exists():
-            return 'unknown'
-
-        last_subagent_type = None
-        with open(session_file, 'r') as f:
-            for line in f:
-                try:
-                    data = json.loads(line)
-                    message = data.get('message', {})
-                    content = message.get('content', [])
-                    for item in content:
-                        if isinstance(item, dict) and item.get('type') == 'tool_use' and item.get('name') == 'Task':
-                            input_params = item.get('input', {})
-                            if 'subagent_type' in input_params:
-                                last_subagent_type = input_params['subagent_type']
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    continue
-
-        return last_subagent_type or 'unknown'
+
+        with open(session_file, 'rb') as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            buf = b''
+            while pos > 0:
+                chunk_size = min(65536, pos)
+                pos -= chunk_size
+                f.seek(pos)
+                buf = f.read(chunk_size) + buf
+                lines = buf.split(b'\n')
+                # First piece may be a partial line continuing into the
+                # previous (not yet read) chunk — carry it over.
+                buf = lines.pop(0) if pos > 0 else b''
+                for line in reversed(lines):
+                    # Cheap bytes probes before paying for json.loads —
+                    # a Task invocation line must carry both markers
+                    if b'"subagent_type"' not in line or b'"tool_use"' not in line:
+                        continue
+                    name = _subagent_type_from_line(line)
+                    if name:
+                        return name
+
+        return 'unknown'
     except Exception:
         return 'unknown'
 
@@ -75,10 +112,22 @@ def save_transcript(agent_name: str, transcript_path: str, agent_id: str) -> boo
         session_dir = OUTPUT_DIR / today / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
-        existing = list(session_dir.glob('*.jsonl'))
-        next_num = len(existing) + 1
+        # Sequence number lives in a counter file — O(1) vs globbing and
+        # stat-ing every transcript already saved for this session
+        counter_file = session_dir / '_next'
+        try:
+            next_num = int(counter_file.read_text())
+        except (OSError, ValueError):
+            next_num = len(list(session_dir.glob('*.jsonl'))) + 1
+        counter_file.write_text(str(next_num + 1))
         dest = session_dir / f"{next_num:03d}-{agent_name}.jsonl"
-        shutil.copy(transcript_path, dest)
+        try:
+            # Same filesystem (~/.claude) — a hardlink is zero-copy vs
+            # streaming a multi-MB transcript through the page cache
+            os.link(transcript_path, dest)
+        except OSError:
+            import shutil
+            shutil.copy(transcript_path, dest)
 
         log(f"Transcript saved: {dest}", "INFO")
         return True
@@ -91,7 +140,7 @@ def main():
     log("Hook triggered (SubagentStop event)", "INFO")
 
     try:
-        data = json.load(sys.stdin)
+        data = _loads(sys.stdin.buffer.read())
 
         agent_name = (
             data.get('agentName') or
@@ -116,7 +165,7 @@ def main():
 
         log(f"Subagent completed: {agent_name}", "INFO")
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         log(f"JSON decode error: {e}", "ERROR")
     except Exception as e:
         log(f"Unexpected error: {e}", "ERROR")
@@ -5,11 +5,36 @@ Replaces per-hook hardcoded ALEX_VOICE_ID and VOICE_SERVER_URL.
 Uses the voice server's agent routing (voices.json) instead of raw voice IDs.
 """
 
+import json
+import socket
 import subprocess
 
-import requests
+VOICE_SERVER_HOST = "localhost"
+VOICE_SERVER_PORT = 8888
+VOICE_SERVER_URL = f"http://{VOICE_SERVER_HOST}:{VOICE_SERVER_PORT}"
 
-VOICE_SERVER_URL = "http://localhost:8888"
+# UNIX-socket fast path served by utils/voice_daemon.py — sub-ms vs. a
+# fresh loopback HTTP request. Falls back to HTTP when the daemon is down.
+VOICE_SOCKET_PATH = "/tmp/pai-voice.sock"
+
+
+def _http_request(method: str, path: str, payload: dict | None = None, timeout: int = 3) -> int:
+    """One loopback HTTP exchange via stdlib http.client.
+
+    Hooks are short-lived subprocesses, so the HTTP fallback fires at
+    most once per process — stdlib keeps the cold path free of the
+    requests import tree (urllib3, charset_normalizer, idna, certifi),
+    which dominates hook start-up time.
+    """
+    import http.client
+    conn = http.client.HTTPConnection(VOICE_SERVER_HOST, VOICE_SERVER_PORT, timeout=timeout)
+    try:
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse().status
+    finally:
+        conn.close()
 
 # Map Claude Code agents/subagent_types → voice server personas (from voices.json)
 AGENT_VOICE_MAP = {
@@ -46,16 +71,47 @@ AGENT_VOICE_MAP = {
 }
 
 
+def _speak_socket(message: str, voice_agent: str) -> bool:
+    """Fire-and-forget the payload to the voice daemon's datagram socket.
+
+    A single sendto() with no ack and no timeout — the hook never waits
+    on the daemon. A dead daemon raises immediately (unbound socket
+    path), which routes us to the HTTP fallback.
+    """
+    try:
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        s.sendto(
+            json.dumps({"message": message, "agent": voice_agent}).encode() + b"\n",
+            VOICE_SOCKET_PATH,
+        )
+        s.close()
+        return True
+    except Exception:
+        return False
+
+
 def speak(message: str, agent: str = "alex", timeout: int = 3) -> bool:
     """Agent-aware voice via POST /speak (auto-selects voice from voices.json)."""
     try:
         voice_agent = AGENT_VOICE_MAP.get(agent, "alex")
-        response = requests.post(
-            f"{VOICE_SERVER_URL}/speak",
-            json={"message": message, "agent": voice_agent},
-            timeout=timeout,
-        )
-        return response.status_code == 200
+        if _speak_socket(message, voice_agent):
+            return True
+        # HTTP fallback: detach so the hook never blocks on server RTT.
+        # The child owns the POST; the parent reports success optimistically
+        # (same contract as the datagram path — delivery is best-effort).
+        import os
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.setsid()
+                _http_request(
+                    "POST", "/speak",
+                    payload={"message": message, "agent": voice_agent},
+                    timeout=timeout,
+                )
+            finally:
+                os._exit(0)
+        return True
     except Exception:
         return False
 
@@ -86,7 +142,6 @@ def speak_and_notify(message: str, agent: str = "alex", title: str = "Alex") ->
 def is_server_healthy(timeout: int = 2) -> bool:
     """Check if the voice server is running."""
     try:
-        r = requests.get(f"{VOICE_SERVER_URL}/health", timeout=timeout)
-        return r.status_code == 200
+        return _http_request("GET", "/health", timeout=timeout) == 200
     except Exception:
         return False
@@ -0,0 +1,75 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# dependencies = ["requests"]
+# ///
+
+"""
+Voice Daemon — persistent UNIX-socket sidecar for voice notifications.
+
+Hooks are short-lived processes; importing requests and opening a TCP
+connection to the voice server dominates their notification path. This
+daemon holds one pooled HTTP connection to the voice server and accepts
+line-delimited JSON ({"message": ..., "agent": ...}) on a UNIX socket.
+
+Run once (e.g. from launchd or a login shell):
+    uv run ~/.claude/hooks/utils/voice_daemon.py
+"""
+
+import json
+import os
+import socket
+
+import requests
+
+VOICE_SERVER_URL = "http://localhost:8888"
+SOCKET_PATH = "/tmp/pai-voice.sock"
+
+_session = requests.Session()
+_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+
+def handle_line(line: bytes):
+    """Forward one JSON payload to the voice server."""
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError:
+        return
+    message = payload.get("message")
+    if not message:
+        return
+    try:
+        _session.post(
+            f"{VOICE_SERVER_URL}/speak",
+            json={"message": message, "agent": payload.get("agent", "alex")},
+            timeout=3,
+        )
+    except Exception:
+        pass
+
+
+def serve():
+    """Receive datagrams forever, one JSON payload each.
+
+    SOCK_DGRAM keeps the hook side to a single fire-and-forget sendto()
+    — no accept/connect roundtrip and no response to wait for.
+    """
+    try:
+        os.unlink(SOCKET_PATH)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(SOCKET_PATH)
+    os.chmod(SOCKET_PATH, 0o600)
+
+    while True:
+        try:
+            data = server.recv(65536)
+            for line in data.splitlines():
+                handle_line(line)
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,206 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "pyyaml>=6.0",
+# ]
+# ///
+"""
+PAI Skill Health — frontmatter validation for SKILL.md files.
+
+Script backend for the /skill-health command: reads each skill's YAML
+frontmatter for last_reviewed / review_cycle and reports overdue or
+unannotated skills. Reference-integrity and git-staleness checks stay
+agent-side in commands/skill-health.md.
+
+Usage:
+    skill_health.py <skill-dir>      # one skill
+    skill_health.py --all            # sweep the whole skills tree
+"""
+
+import argparse
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+DEFAULT_CYCLE_DAYS = 90
+# Tier-2 bodies are meant to stay around the ~4k-token budget; flag
+# skills whose word count runs far past it
+WORD_BUDGET = 5000
+
+# Compiled once — validate_skill runs per file on --all sweeps
+_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*$")
+
+
+def _yaml_frontmatter(block: str) -> dict:
+    """Full YAML parse, only for frontmatter the fast path can't handle."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
+    try:
+        meta = yaml.load(block, Loader=_Loader)
+    except yaml.YAMLError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def frontmatter_block(data: bytes) -> str:
+    """Slice the frontmatter out of raw SKILL.md bytes.
+
+    Fence-finding happens on the byte buffer (memchr under the hood) and
+    only the frontmatter slice gets decoded — the body, usually the bulk
+    of the file, is never turned into str.
+    """
+    if not data.startswith(b"---"):
+        return ""
+    end = data.find(b"\n---", 3)
+    if end < 0:
+        return ""
+    return data[3:end].decode("utf-8", errors="replace")
+
+
+def parse_frontmatter(block: str) -> dict:
+    """Parse a frontmatter block without paying for a YAML load.
+
+    Skill frontmatter is flat key: value pairs plus one level of nesting
+    under keys like metadata: — a line parser covers that in one pass.
+    Anything structurally richer falls back to PyYAML (libyaml's C
+    loader when available).
+    """
+    if not block:
+        return {}
+
+    meta: dict = {}
+    target = meta
+    for line in block.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, value = stripped.partition(":")
+        if not sep or stripped.startswith("- "):
+            # Lists or non key:value lines — not the simple shape
+            return _yaml_frontmatter(block)
+        value = value.strip().strip('"').strip("'")
+        if line.startswith((" ", "\t")):
+            target[key.strip()] = value
+        elif value:
+            target = meta
+            meta[key.strip()] = value
+        else:
+            # Bare "key:" opens a nested block (e.g. metadata:)
+            target = meta.setdefault(key.strip(), {})
+    return meta
+
+
+def validate_skill(skill_md: Path, skills_root: Path, today: date) -> dict:
+    """Health record for one SKILL.md: review age vs its cycle."""
+    rel = skill_md.parent.relative_to(skills_root) if skills_root in skill_md.parents else skill_md.parent
+    data = skill_md.read_bytes()
+    meta = parse_frontmatter(frontmatter_block(data))
+    # Separator counting approximates words on the raw bytes — no decode
+    # and no list of word objects just to take its length
+    word_count = data.count(b" ") + data.count(b"\n") + 1
+    nested = meta.get("metadata") if isinstance(meta.get("metadata"), dict) else {}
+
+    last_reviewed = nested.get("last_reviewed") or meta.get("last_reviewed")
+    try:
+        cycle = int(nested.get("review_cycle") or meta.get("review_cycle") or DEFAULT_CYCLE_DAYS)
+    except (TypeError, ValueError):
+        cycle = DEFAULT_CYCLE_DAYS
+
+    name = meta.get("name")
+    record = {
+        "skill": f"{rel}/",
+        "cycle": cycle,
+        "days": None,
+        "status": "needs-metadata",
+        "bad_name": bool(name) and not _NAME_RE.match(str(name)),
+        "oversized": word_count > WORD_BUDGET,
+    }
+    if last_reviewed:
+        try:
+            reviewed = datetime.fromisoformat(str(last_reviewed)).date()
+        except ValueError:
+            return record
+        record["days"] = (today - reviewed).days
+        record["status"] = "overdue" if record["days"] > cycle else "ok"
+    return record
+
+
+def _format_line(record: dict) -> str:
+    name = f"{record['skill']:<24}"
+    if record["status"] == "needs-metadata":
+        line = f"{name} ⚠ no last_reviewed date — needs metadata"
+    else:
+        line = f"{name} {'⚠' if record['status'] == 'overdue' else '✓'} reviewed {record['days']}d ago (cycle: {record['cycle']}d)"
+        if record["status"] == "overdue":
+            line += " — OVERDUE"
+    if record["bad_name"]:
+        line += " — name not kebab-case"
+    if record["oversized"]:
+        line += " — body over word budget"
+    return line
+
+
+def run_report(skill_paths: list[Path], skills_root: Path) -> int:
+    today = date.today()
+    if len(skill_paths) > 1:
+        # The sweep is embarrassingly parallel (read + parse per file);
+        # workers return records and all printing stays in main
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+        check = partial(validate_skill, skills_root=skills_root, today=today)
+        with ProcessPoolExecutor() as ex:
+            records = list(ex.map(check, skill_paths, chunksize=8))
+    else:
+        records = [validate_skill(p, skills_root, today) for p in skill_paths]
+
+    out = ["Skill Health Report\n───────────────────\n"]
+    out.extend(_format_line(r) + "\n" for r in records)
+
+    overdue = sum(r["status"] == "overdue" for r in records)
+    missing = sum(r["status"] == "needs-metadata" for r in records)
+    bad_names = sum(r["bad_name"] for r in records)
+    oversized = sum(r["oversized"] for r in records)
+    summary = f"\nSummary: {len(records)} skills checked, {overdue} overdue, {missing} missing metadata"
+    if bad_names:
+        summary += f", {bad_names} invalid names"
+    if oversized:
+        # Advisory only — over-budget bodies don't fail the sweep
+        summary += f", {oversized} over word budget (advisory)"
+    out.append(summary + "\n")
+    sys.stdout.write("".join(out))
+    return 1 if overdue or missing or bad_names else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PAI skill frontmatter health check")
+    parser.add_argument("skill", nargs="?", default=None, help="Path to one skill directory")
+    parser.add_argument("--all", action="store_true", help="Sweep every SKILL.md under the skills root")
+    parser.add_argument("--skills-dir", default=str(Path.home() / ".claude" / "skills"))
+    args = parser.parse_args()
+
+    skills_root = Path(args.skills_dir)
+    if args.all:
+        paths = sorted(skills_root.rglob("SKILL.md"))
+    elif args.skill:
+        candidate = Path(args.skill)
+        paths = [candidate if candidate.name == "SKILL.md" else candidate / "SKILL.md"]
+        if not paths[0].exists():
+            print(f"No SKILL.md found at {paths[0]}", file=sys.stderr)
+            raise SystemExit(1)
+    else:
+        parser.error("give a skill directory or --all")
+
+    if not paths:
+        print(f"No SKILL.md files under {skills_root}", file=sys.stderr)
+        raise SystemExit(1)
+
+    raise SystemExit(run_report(paths, skills_root))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,792 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "pyyaml>=6.0",
+#     "orjson",
+# ]
+# ///
+"""
+PAI Task Manager — persistent, git-synced project tasks.
+
+Unified backend for the /tasks, /task-manage, /create-tasks, /task-add,
+/task-update and /task-complete commands. Tasks live in three JSON
+containers (active.json / backlog.json / completed.json), either
+project-local (.claude/tasks/) or global (~/.claude/tasks/).
+
+Usage:
+    task_manager.py list [filter]
+    task_manager.py create <markdown-file>
+    task_manager.py add <title> [--priority high] [--notes ...] [--tags a,b]
+    task_manager.py update <id> <field> <value>
+    task_manager.py complete <id>
+
+See ~/.claude/docs/TASK-MANAGEMENT.md for the schema.
+"""
+
+import argparse
+import itertools
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+    import json
+
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(obj: dict) -> bytes:
+        return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode()
+
+
+VERSION = "1.0.0"
+TASK_FILES = ("active.json", "backlog.json", "completed.json")
+PRIORITIES = ("critical", "high", "medium", "low")
+STATUSES = ("pending", "in_progress", "blocked", "completed")
+
+# Display ordering for cmd_list — unknown values sort last
+PRIORITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+STATUS_RANK = {"in_progress": 0, "blocked": 1, "pending": 2}
+PRIORITY_EMOJI = {"critical": "🚨", "high": "🔥", "medium": "📋", "low": "📌"}
+# Keywords in task titles that map to tags (used by create)
+TAG_KEYWORDS = {
+    "backend": ["backend", "api", "endpoint", "server", "database", "sql"],
+    "frontend": ["frontend", "ui", "ux", "component", "css", "react"],
+    "auth": ["auth", "login", "jwt", "token", "password", "session"],
+    "testing": ["test", "tests", "testing", "coverage", "e2e"],
+    "docs": ["docs", "documentation", "readme"],
+    "infra": ["deploy", "docker", "ci", "infra", "pipeline"],
+}
+
+
+# Task schema: core keys with fallbacks plus optional keys with defaults —
+# the single source of truth for task shape across add/update
+_SCHEMA_CORE = (
+    ("id", None),
+    ("title", ""),
+    ("status", "pending"),
+    ("priority", "medium"),
+    ("created", ""),
+    ("updated", ""),
+)
+_SCHEMA_DEFAULTS = (
+    ("completed", None),
+    ("source_file", None),
+    ("source_line", None),
+    ("notes", None),
+    ("tags", []),
+    ("blocked_by", None),
+    ("depends_on", []),
+)
+
+
+def _normalize(task: dict) -> dict:
+    """Project a dict onto the task schema, filling defaults.
+
+    Containers are git-synced and hand-editable, so a stored task may be
+    missing any key — fall back instead of crashing.
+    """
+    norm = {k: task.get(k, default) for k, default in _SCHEMA_CORE}
+    for k, default in _SCHEMA_DEFAULTS:
+        v = task.get(k, default)
+        if isinstance(default, list):
+            norm[k] = list(v) if v else []
+        else:
+            norm[k] = v
+    return norm
+
+
+def now_iso() -> str:
+    """Return current UTC time as ISO string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def detect_tasks_dir() -> Path:
+    """Project-local .claude/tasks/ wins; fall back to global ~/.claude/tasks/."""
+    local = Path.cwd() / ".claude" / "tasks"
+    if local.is_dir():
+        return local
+    return Path.home() / ".claude" / "tasks"
+
+
+def format_date(iso_str: str) -> str:
+    """Render an ISO timestamp as YYYY-MM-DD for display.
+
+    Well-formed ISO strings — everything this tool writes — are just
+    sliced; the datetime round-trip only runs for anything odd.
+    """
+    if not iso_str:
+        return ""
+    if len(iso_str) >= 10 and iso_str[4] == "-" and iso_str[7] == "-":
+        return iso_str[:10]
+    try:
+        return datetime.fromisoformat(iso_str).strftime("%Y-%m-%d")
+    except ValueError:
+        return iso_str[:10]
+
+
+def calculate_duration(created: str, completed: str) -> str:
+    """Human-readable duration between two ISO timestamps."""
+    try:
+        delta = datetime.fromisoformat(completed) - datetime.fromisoformat(created)
+    except ValueError:
+        return ""
+    days = delta.days
+    hours = delta.seconds // 3600
+    if days > 0:
+        return f"{days}d {hours}h"
+    minutes = (delta.seconds % 3600) // 60
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+class TaskManager:
+    """File-backed task store over the three JSON containers."""
+
+    def __init__(self, tasks_dir: Path | None = None):
+        self.tasks_dir = tasks_dir or detect_tasks_dir()
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+        # mtime-validated parse cache: find/update/list sequences hit the
+        # same container files several times per CLI invocation
+        self._cache: dict[Path, tuple[int, dict]] = {}
+        # id -> container-name index, loaded lazily on first lookup
+        self._index: dict[int, str] | None = None
+
+    def _path(self, name: str) -> Path:
+        return self.tasks_dir / name
+
+    def _read_json(self, path: Path) -> dict:
+        """Read a container file, returning an empty container when missing/corrupt."""
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+        try:
+            data = _loads(path.read_bytes())
+        except (OSError, ValueError):
+            ts = now_iso()
+            return {
+                "version": VERSION,
+                "source": None,
+                "created": ts,
+                "last_updated": ts,
+                "tasks": [],
+            }
+
+        if mtime_ns is not None:
+            self._cache[path] = (mtime_ns, data)
+        return data
+
+    def _stage(self, path: Path, data: dict, now: str | None = None) -> Path:
+        """Serialize a container to a sibling temp file; pair with _publish."""
+        # Callers that touch several timestamps in one operation thread a
+        # single now_iso() result through instead of re-formatting per write
+        data["last_updated"] = now or now_iso()
+        tmp = path.with_name(path.name + ".tmp")
+        # _dumps already yields bytes; a raw fd write skips the buffered
+        # I/O layer and lands the payload in one syscall
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _dumps(data))
+        finally:
+            os.close(fd)
+        return tmp
+
+    def _publish(self, path: Path, tmp: Path, data: dict):
+        """Rename a staged temp file into place and refresh the cache."""
+        os.replace(tmp, path)
+        try:
+            self._cache[path] = (path.stat().st_mtime_ns, data)
+        except OSError:
+            self._cache.pop(path, None)
+
+    def _write_json(self, path: Path, data: dict, now: str | None = None):
+        self._publish(path, self._stage(path, data, now=now), data)
+
+    def iter_tasks(self):
+        """Yield tasks across active, backlog and completed, without copying."""
+        for name in TASK_FILES:
+            yield from self._read_json(self._path(name)).get("tasks", [])
+
+    def get_all_tasks(self) -> list[dict]:
+        """All tasks across the three containers as a list."""
+        return list(self.iter_tasks())
+
+    def get_next_id(self, now: str | None = None) -> int:
+        """Next unique task ID, from the counter stored in active.json.
+
+        The counter only ever moves forward, so IDs stay unique even as
+        tasks migrate into completed.json. Containers written before the
+        counter existed are migrated with a one-time scan.
+        """
+        path = self._path("active.json")
+        data = self._read_json(path)
+        next_id = data.get("next_id")
+        if next_id is None:
+            next_id = 1
+            for task in self.iter_tasks():
+                if task.get("id", 0) >= next_id:
+                    next_id = task["id"] + 1
+        data["next_id"] = next_id + 1
+        self._write_json(path, data, now=now)
+        return next_id
+
+    def _get_index(self) -> dict[int, str]:
+        """id -> container-name map, rebuilt from the containers if missing."""
+        if self._index is None:
+            try:
+                raw = _loads((self.tasks_dir / "index.json").read_bytes())
+                self._index = {int(k): v for k, v in raw.items()}
+            except (OSError, ValueError):
+                self._index = self._rebuild_index()
+        return self._index
+
+    def _rebuild_index(self) -> dict[int, str]:
+        index = {}
+        for name in TASK_FILES:
+            for task in self._read_json(self._path(name)).get("tasks", []):
+                if task.get("id") is not None:
+                    index[task["id"]] = name
+        self._index = index
+        self._save_index()
+        return index
+
+    def _save_index(self):
+        # Plain write, no staging — the index is a rebuildable cache
+        if self._index is not None:
+            payload = {str(k): v for k, v in self._index.items()}
+            (self.tasks_dir / "index.json").write_bytes(_dumps(payload))
+
+    def _index_set(self, task_id: int, name: str):
+        index = self._get_index()
+        if index.get(task_id) != name:
+            index[task_id] = name
+            self._save_index()
+
+    def _scan_container(self, name: str, task_id: int) -> tuple[dict | None, dict, int]:
+        data = self._read_json(self._path(name))
+        for i, task in enumerate(data.get("tasks", [])):
+            if task.get("id") == task_id:
+                return task, data, i
+        return None, data, -1
+
+    def _locate(self, task_id: int) -> tuple[dict | None, str | None, dict | None, int]:
+        """Find a task and keep the loaded container + index for reuse.
+
+        The persisted id->container index turns the three-file scan into
+        one targeted read; a stale entry (e.g. files edited by hand or
+        synced from another machine) falls back to the full scan and a
+        rebuild.
+        """
+        hinted = self._get_index().get(task_id)
+        if hinted:
+            task, data, i = self._scan_container(hinted, task_id)
+            if task is not None:
+                return task, hinted, data, i
+
+        for name in TASK_FILES:
+            task, data, i = self._scan_container(name, task_id)
+            if task is not None:
+                self._rebuild_index()
+                return task, name, data, i
+        return None, None, None, -1
+
+    def find_task(self, task_id: int) -> tuple[dict | None, str | None]:
+        """Locate a task by ID. Returns (task, container filename)."""
+        task, name, _, _ = self._locate(task_id)
+        return task, name
+
+    def add_task(
+        self,
+        title: str,
+        status: str = "pending",
+        priority: str = "medium",
+        notes: str | None = None,
+        tags: list[str] | None = None,
+        source_file: str | None = None,
+        source_line: int | None = None,
+        blocked_by: str | None = None,
+    ) -> dict:
+        """Create and persist a new task."""
+        ts = now_iso()
+        task = _normalize({
+            "id": self.get_next_id(now=ts),
+            "title": title,
+            "status": status,
+            "priority": priority,
+            "created": ts,
+            "updated": ts,
+            "completed": ts if status == "completed" else None,
+            "source_file": source_file,
+            "source_line": source_line,
+            "notes": notes,
+            "tags": tags,
+            "blocked_by": blocked_by,
+        })
+        target = "completed.json" if status == "completed" else "active.json"
+        data = self._read_json(self._path(target))
+        data.setdefault("tasks", []).append(task)
+        self._write_json(self._path(target), data, now=ts)
+        self._index_set(task["id"], target)
+        return task
+
+    def update_task(self, task_id: int, **fields) -> dict | None:
+        """Update fields on a task, normalizing enums and tag lists."""
+        task, name, data, index = self._locate(task_id)
+        if task is None:
+            return None
+
+        # Normalize enum-ish fields before the single-pass merge
+        if fields.get("status"):
+            fields["status"] = fields["status"].strip().lower()
+        if fields.get("priority"):
+            fields["priority"] = fields["priority"].strip().lower()
+        if isinstance(fields.get("tags"), str):
+            fields["tags"] = [tg.strip() for tg in fields["tags"].split(",") if tg.strip()]
+
+        ts = now_iso()
+        updated = _normalize({**task, **{k: v for k, v in fields.items() if v is not None}})
+        updated["updated"] = ts
+        data["tasks"][index] = updated
+        self._write_json(self._path(name), data, now=ts)
+        return updated
+
+    def bulk_update(self, fields_by_id: dict[int, dict]) -> int:
+        """Patch fields on many tasks with one write per touched container.
+
+        Batched counterpart to update_task for callers like cmd_create
+        that would otherwise rewrite a container once per patched task.
+        """
+        if not fields_by_id:
+            return 0
+        ts = now_iso()
+        patched = 0
+        for name in TASK_FILES:
+            path = self._path(name)
+            data = self._read_json(path)
+            dirty = False
+            for i, task in enumerate(data.get("tasks", [])):
+                fields = fields_by_id.get(task.get("id"))
+                if fields is None:
+                    continue
+                updated = _normalize({**task, **{k: v for k, v in fields.items() if v is not None}})
+                updated["updated"] = ts
+                data["tasks"][i] = updated
+                dirty = True
+                patched += 1
+            if dirty:
+                self._write_json(path, data, now=ts)
+        return patched
+
+    def _move_task(self, task_id: int, dest_name: str, status: str | None = None) -> dict | None:
+        """Move a task between containers, optionally updating status."""
+        task, name, src, index = self._locate(task_id)
+        if task is None:
+            return None
+        if name == dest_name:
+            return task
+
+        del src["tasks"][index]
+
+        ts = now_iso()
+        if status:
+            task["status"] = status
+            if status == "completed":
+                task["completed"] = ts
+        task["updated"] = ts
+
+        dest = self._read_json(self._path(dest_name))
+        dest.setdefault("tasks", []).append(task)
+
+        # Stage both containers before publishing either, so the renames
+        # land back-to-back and the window where the task exists in
+        # neither (or both) files stays as small as the two rename calls
+        src_path, dest_path = self._path(name), self._path(dest_name)
+        src_tmp = self._stage(src_path, src, now=ts)
+        dest_tmp = self._stage(dest_path, dest, now=ts)
+        self._publish(src_path, src_tmp, src)
+        self._publish(dest_path, dest_tmp, dest)
+        self._index_set(task_id, dest_name)
+        return task
+
+    def complete_task(self, task_id: int) -> dict | None:
+        """Mark a task completed and archive it."""
+        return self._move_task(task_id, "completed.json", status="completed")
+
+
+# Process-wide TaskManager — the cmd_* handlers share one instance so
+# its parse caches and index survive across operations in one process
+_TM = None
+
+
+def get_tm() -> TaskManager:
+    global _TM
+    if _TM is None:
+        _TM = TaskManager()
+    return _TM
+
+
+def cmd_list(args):
+    """Display active tasks grouped by priority."""
+    tm = get_tm()
+    data = tm._read_json(tm._path("active.json"))
+    tasks = data.get("tasks", [])
+
+    filt = (args.filter or "").strip().lower()
+    field = None
+    if filt:
+        if filt in PRIORITIES:
+            field = "priority"
+        elif filt in STATUSES:
+            field = "status"
+        else:
+            print(f"Unknown filter: {filt} (use a priority or status)")
+            return 1
+        # Generator — the filter folds into the sort's single pass
+        # instead of materializing an intermediate list
+        tasks = (t for t in tasks if t.get(field) == filt)
+
+    # One sort on a (priority, status, created) tuple replaces the
+    # bucket-then-sort-each pass; headers fall out of the monotonic walk
+    ordered = sorted(tasks, key=lambda t: (
+        PRIORITY_RANK.get(t.get("priority", "medium"), 4),
+        STATUS_RANK.get(t.get("status"), 3),
+        t.get("created", ""),
+    ))
+
+    if not ordered:
+        print("No active tasks found." if not filt else f"No tasks match filter: {filt}")
+        return 0
+
+    # Accumulate and emit once — per-field print() calls are a syscall
+    # each on a line-buffered TTY, which dominates for long lists
+    out = ["🎯 ACTIVE TASKS\n"]
+    prev_priority = None
+    for task in ordered:
+        # Bind fields once — the formatting below would otherwise hash
+        # into the task dict eight-plus times per row
+        get = task.get
+        priority = get("priority", "medium")
+        status = get("status")
+        source_file = get("source_file")
+        notes = get("notes")
+        blocked_by = get("blocked_by")
+
+        if priority != prev_priority:
+            out.append(f"\n{PRIORITY_EMOJI.get(priority, '📋')} {priority.upper()} PRIORITY\n")
+            prev_priority = priority
+        out.append(f"#{get('id')} - {get('title')} [{status}]\n")
+
+        created = format_date(get("created"))
+        if source_file:
+            source_line = get("source_line")
+            source = f"{source_file}:{source_line}" if source_line else source_file
+            out.append(f"     Created: {created} | Source: {source}\n")
+        else:
+            out.append(f"     Created: {created}\n")
+
+        if notes:
+            out.append(f"     Notes: {notes}\n")
+        if status == "blocked" and blocked_by:
+            out.append(f"     Blocked by: {blocked_by}\n")
+
+    counts: dict[str, int] = {}
+    for task in ordered:
+        counts[task.get("status", "pending")] = counts.get(task.get("status", "pending"), 0) + 1
+    summary = ", ".join(f"{n} {s}" for s, n in counts.items())
+    out.append(f"\n---\nTotal: {len(ordered)} tasks ({summary})\n")
+    sys.stdout.write("".join(out))
+    return 0
+
+
+_CHECKBOX_RE = re.compile(r"^[-*+]\s+\[( |x|X)\]\s+(.+)$")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.*)$")
+
+# Single alternation scans replace the chained substring tests in the
+# create parser: one pass for blocked markers, one for priority headings
+_BLOCKED_RE = re.compile(r"\*\*BLOCKED\*\*|[🚫⛔🔒]")
+_PRIORITY_HEADING_RE = re.compile(r"\b(critical|high|medium|low)\b")
+
+# One alternation scan per title instead of a substring test per keyword
+_TAG_KW_RE = re.compile(r"\b(" + "|".join(
+    kw for kws in TAG_KEYWORDS.values() for kw in kws
+) + r")\b")
+_KW_TO_TAG = {kw: tag for tag, kws in TAG_KEYWORDS.items() for kw in kws}
+
+
+def _tags_for_title(title_lower: str) -> list[str]:
+    """Map keyword hits in a lowercased title to their tags, deduplicated."""
+    tags = []
+    for kw in _TAG_KW_RE.findall(title_lower):
+        tag = _KW_TO_TAG[kw]
+        if tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def _frontmatter_source(text: str) -> str | None:
+    """Pull an optional 'source' field out of YAML frontmatter."""
+    if not text.startswith("---"):
+        return None
+    parts = text.split("---", 2)
+    if len(parts) < 3:
+        return None
+    # Deferred — yaml costs tens of ms at import and only the create
+    # subcommand (on files with frontmatter) ever needs it
+    import yaml
+    try:
+        meta = yaml.safe_load(parts[1]) or {}
+    except yaml.YAMLError:
+        return None
+    return meta.get("source") if isinstance(meta, dict) else None
+
+
+def cmd_create(args):
+    """Parse a markdown plan/PRD into tasks."""
+    tm = get_tm()
+    path = Path(args.file)
+    if not path.exists():
+        print(f"File not found: {args.file}", file=sys.stderr)
+        return 1
+
+    # Stream the file instead of materializing text + a split list —
+    # peak memory stays at one line-buffer regardless of plan size
+    fh = open(path, encoding="utf-8")
+    start = 1
+    first = fh.readline()
+    stream = itertools.chain([first], fh)
+    fm_source = None
+    if first.startswith("---"):
+        # Consume the frontmatter block up front; the task parser never
+        # needs to see it. Bounded — an opening rule with no closing
+        # fence is plan body, not frontmatter, and must still be parsed.
+        fm = [first]
+        closed = False
+        for line in fh:
+            fm.append(line)
+            if line.rstrip() == "---":
+                closed = True
+                break
+            if len(fm) > 64:
+                break
+        if closed:
+            fm_source = _frontmatter_source("".join(fm))
+            start = len(fm) + 1
+            stream = fh
+        else:
+            stream = itertools.chain(fm, fh)
+
+    current_priority = "medium"
+    created_tasks: list[dict] = []
+    completed_count = 0
+    last_task_id = None
+    # Notes accumulate here during the parse and land in one batched
+    # write at the end, instead of a container rewrite per note line
+    pending_notes: dict[int, str] = {}
+
+    for lineno, line in enumerate(stream, start):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        heading = _HEADING_RE.match(stripped)
+        if heading:
+            m = _PRIORITY_HEADING_RE.search(heading.group(1).lower())
+            if m:
+                current_priority = m.group(1)
+            last_task_id = None
+            continue
+
+        checkbox = _CHECKBOX_RE.match(stripped)
+        if checkbox:
+            done = checkbox.group(1).lower() == "x"
+            title = checkbox.group(2).strip()
+
+            status = "completed" if done else "pending"
+            blocked_by = None
+            if _BLOCKED_RE.search(line):
+                status = "blocked"
+                blocked_by = "Marked blocked in source document"
+
+            tags = _tags_for_title(title.lower())
+
+            task = tm.add_task(
+                title=title,
+                status=status,
+                priority=current_priority,
+                tags=tags,
+                source_file=str(path),
+                source_line=lineno,
+                blocked_by=blocked_by,
+            )
+            if done:
+                completed_count += 1
+            else:
+                created_tasks.append(task)
+            last_task_id = task["id"]
+            continue
+
+        # Indented bullets under a task become its notes
+        if last_task_id and line.startswith((" ", "\t")) and stripped.startswith(("-", "*", "+")):
+            note = stripped.lstrip("-*+ ").strip()
+            if note:
+                existing = pending_notes.get(last_task_id)
+                pending_notes[last_task_id] = f"{existing}. {note}" if existing else note
+
+    fh.close()
+    tm.bulk_update({tid: {"notes": notes} for tid, notes in pending_notes.items()})
+
+    # Record where these tasks came from on the container (schema's
+    # source field), first writer wins
+    if fm_source and created_tasks:
+        data = tm._read_json(tm._path("active.json"))
+        if not data.get("source"):
+            data["source"] = fm_source
+            tm._write_json(tm._path("active.json"), data)
+
+    total = len(created_tasks) + completed_count
+    if total == 0:
+        print(f"No tasks found in {args.file} (expected '- [ ]' checkboxes).")
+        return 0
+
+    # Single buffered write, same as cmd_list
+    out = [
+        f"✅ TASKS CREATED FROM: {args.file}\n"
+        "\n"
+        "📊 SUMMARY:\n"
+        f"- Created: {len(created_tasks)} tasks in active.json\n"
+        f"- Completed: {completed_count} tasks in completed.json\n"
+        f"- Total: {total} tasks parsed\n"
+    ]
+    out.append("".join(f"#{task['id']} - {task['title']} [{task['priority']}]\n" for task in created_tasks))
+    out.append("\nRun /tasks to view active tasks\n")
+    sys.stdout.write("".join(out))
+    return 0
+
+
+def cmd_add(args):
+    """Add a single task from the command line."""
+    tm = get_tm()
+    tags = [t.strip() for t in (args.tags or "").split(",") if t.strip()]
+    task = tm.add_task(
+        title=args.title,
+        priority=args.priority,
+        notes=args.notes,
+        tags=tags,
+    )
+    out = (
+        "✅ TASK ADDED\n"
+        "\n"
+        f"#{task['id']} - {task['title']}\n"
+        f"Priority: {task['priority']}\n"
+        f"Status: {task['status']}\n"
+    )
+    if tags:
+        out += f"Tags: {', '.join(tags)}\n"
+    sys.stdout.write(out)
+    return 0
+
+
+def cmd_update(args):
+    """Update a single field on a task."""
+    tm = get_tm()
+    task, _ = tm.find_task(args.id)
+    if task is None:
+        print(f"Task not found: #{args.id}", file=sys.stderr)
+        return 1
+
+    old_value = task.get(args.field)
+    updated = tm.update_task(args.id, **{args.field: args.value})
+    if updated is None:
+        print(f"Task not found: #{args.id}", file=sys.stderr)
+        return 1
+
+    sys.stdout.write(
+        "✅ TASK UPDATED\n"
+        "\n"
+        f"#{updated['id']} - {updated['title']}\n"
+        f"{args.field.capitalize()}: {old_value} → {updated.get(args.field)}\n"
+        f"Updated: {format_date(updated['updated'])}\n"
+    )
+    return 0
+
+
+def cmd_complete(args):
+    """Mark a task completed and archive it."""
+    tm = get_tm()
+    task, name = tm.find_task(args.id)
+    if task is None:
+        print(f"Task not found: #{args.id}", file=sys.stderr)
+        return 1
+    if name == "completed.json":
+        print(f"Task #{args.id} is already completed.")
+        return 0
+
+    completed = tm.complete_task(args.id)
+    out = (
+        "✅ TASK COMPLETED\n"
+        "\n"
+        f"#{completed['id']} - {completed['title']}\n"
+    )
+    duration = calculate_duration(completed.get("created", ""), completed.get("completed", ""))
+    if duration:
+        out += f"Open for: {duration}\n"
+    out += "Archived to completed.json\n"
+    sys.stdout.write(out)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PAI Task Manager")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="List active tasks")
+    p_list.add_argument("filter", nargs="?", default=None, help="Priority or status filter")
+    p_list.set_defaults(func=cmd_list)
+
+    p_create = sub.add_parser("create", help="Parse a markdown file into tasks")
+    p_create.add_argument("file")
+    p_create.set_defaults(func=cmd_create)
+
+    p_add = sub.add_parser("add", help="Add a single task")
+    p_add.add_argument("title")
+    p_add.add_argument("--priority", default="medium", choices=PRIORITIES)
+    p_add.add_argument("--notes", default=None)
+    p_add.add_argument("--tags", default=None, help="Comma-separated tags")
+    p_add.set_defaults(func=cmd_add)
+
+    p_update = sub.add_parser("update", help="Update a task field")
+    p_update.add_argument("id", type=int)
+    p_update.add_argument("field", choices=["status", "priority", "notes", "tags", "blocked_by", "title"])
+    p_update.add_argument("value")
+    p_update.set_defaults(func=cmd_update)
+
+    p_complete = sub.add_parser("complete", help="Complete and archive a task")
+    p_complete.add_argument("id", type=int)
+    p_complete.set_defaults(func=cmd_complete)
+
+    args = parser.parse_args()
+    raise SystemExit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()